@@ -1,4 +1,6 @@
 from typing import Any
+import asyncio
+import json
 import os
 import httpx
 from mcp.server.fastmcp import FastMCP
@@ -6,16 +8,25 @@ from mcp.server.fastmcp import FastMCP
 # Initialize FastMCP server
 mcp = FastMCP("video_transcriber")
 API_BASE_URL = os.getenv("API_BASE_URL").rstrip("/")
+YOUTUBE_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+# Shared HTTP client so all tools reuse one keep-alive connection pool
+# instead of paying the TCP/TLS handshake on every call
+http_client = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
 
 
 @mcp.tool()
 async def get_projects() -> str:
     """Get a list of projects with transcribed videos"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{API_BASE_URL}/api/projects/")
-            response.raise_for_status()
-            return response.text
+        response = await http_client.get("/api/projects/")
+        response.raise_for_status()
+        return response.content.decode("utf-8")
     except Exception as e:
         return f"Request error: {e}"
 
@@ -27,10 +38,9 @@ async def create_project(project_name: str) -> str:
     Hint: ask the user before naming the project, don't use generic project names, come up with the name from the context of the conversation or use the user's name.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{API_BASE_URL}/api/projects/", json={"name": project_name})
-            response.raise_for_status()
-            return response.text
+        response = await http_client.post("/api/projects/", json={"name": project_name})
+        response.raise_for_status()
+        return response.content.decode("utf-8")
     except Exception as e:
         return f"Request error: {e}"
 
@@ -42,10 +52,30 @@ async def get_video_transcripts(project_id: str) -> str:
     Hint: You can get all projects with their names and ids using get_projects tool.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{API_BASE_URL}/api/videos/?project_id={project_id}")
-            response.raise_for_status()
-            return response.text
+        response = await http_client.get(f"/api/videos/?project_id={project_id}")
+        response.raise_for_status()
+        return response.content.decode("utf-8")
+    except Exception as e:
+        return f"Request error: {e}"
+
+
+@mcp.tool()
+async def get_project_overview(project_id: str) -> str:
+    """
+    Get the list of projects and the video transcripts of one project in a single call
+    Hint: use this instead of calling get_projects and get_video_transcripts one after another — both requests are made at the same time.
+    """
+    try:
+        projects_response, videos_response = await asyncio.gather(
+            http_client.get("/api/projects/"),
+            http_client.get(f"/api/videos/?project_id={project_id}"),
+        )
+        projects_response.raise_for_status()
+        videos_response.raise_for_status()
+        return json.dumps({
+            "projects": projects_response.json(),
+            "videos": videos_response.json()
+        })
     except Exception as e:
         return f"Request error: {e}"
 
@@ -60,23 +90,30 @@ async def transcribe_video(project_id: str, video_url: str) -> str:
     - The video_url must be a full valid youtube video url that begins with https://www.youtube.com/watch?v=
     - The tool will return the video object with it's status immediately. If the video is in the processing status, you can check back on it later by using get_video_transcripts tool with the same project_id (find the needed video in the response by it's id). The video will be transcribed in about a minute.
     """
+    if not video_url.startswith(YOUTUBE_URL_PREFIX):
+        return f"Invalid video_url: expected a link starting with {YOUTUBE_URL_PREFIX}"
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_BASE_URL}/api/videos/",
-                json={
-                    "project_id": project_id,
-                    "link": video_url,
-                    "status": "pending",
-                    "chat_state": "initial"
-                }
-            )
-            response.raise_for_status()
-            return response.text
+        response = await http_client.post(
+            "/api/videos/",
+            json={
+                "project_id": project_id,
+                "link": video_url,
+                "status": "pending",
+                "chat_state": "initial"
+            }
+        )
+        response.raise_for_status()
+        return response.content.decode("utf-8")
     except Exception as e:
         return f"Request error: {e}"
 
 
 if __name__ == "__main__":
+    # Use uvloop for the event loop when available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     # Initialize and run the server
     mcp.run(transport='stdio')